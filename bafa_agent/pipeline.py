@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .audit import persist_pipeline_artifacts
 from .compiler import compile_measure_specs, compile_tables, save_compiled_outputs
 from .communications import render_secretary_memo
 from .engine import evaluate_case
 from .escalation import build_escalation_ticket, should_escalate
-from .extraction import extract_document
+from .extraction import ExtractionOutput, extract_document
 from .guards import (
     activation_guard,
     conflict_guard,
@@ -35,7 +37,7 @@ from .source import (
 from .taxonomy import default_component_taxonomy, default_cost_taxonomy
 from .utils import ensure_dir, read_json, utc_now_iso, write_json
 from .validation import ensure_valid, validate_offer_facts
-from .models import MeasureSpec
+from .models import ManifestDocument, MeasureSpec
 
 DEFAULT_MEASURE_THRESHOLDS: Dict[str, float] = {
     "envelope_aussenwand": 0.20,
@@ -206,6 +208,15 @@ def _write_schema_files(base: Path) -> None:
     write_json(base / "schemas" / "evaluation.schema.json", evaluation_schema)
 
 
+def _extract_source_docs(docs: List[ManifestDocument]) -> List[ExtractionOutput]:
+    # pdftotext runs out of process, so threads overlap the per-document extraction.
+    workers = min(len(docs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [extract_document(doc.local_path, doc.doc_id) for doc in docs]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda doc: extract_document(doc.local_path, doc.doc_id), docs))
+
+
 def compile_rules(
     base_dir: str | Path,
     fetch: bool = False,
@@ -238,8 +249,7 @@ def compile_rules(
         requirements_path.unlink()
 
     all_requirements: List[Dict[str, Any]] = []
-    for doc in manifest.docs:
-        extracted = extract_document(doc.local_path, doc.doc_id)
+    for doc, extracted in zip(manifest.docs, _extract_source_docs(manifest.docs)):
         snippets = detect_requirement_snippets(extracted)
         component = "aussenwand"
         measure = "envelope_aussenwand"
@@ -407,16 +417,29 @@ def compile_rules(
     return build_report
 
 
+# Parsed measure specs per workspace, reused until a spec file changes.
+_MEASURE_SPEC_CACHE: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], Dict[str, MeasureSpec]]] = {}
+
+
 def load_measure_specs(base_dir: str | Path) -> Dict[str, MeasureSpec]:
-    base = Path(base_dir)
+    base = Path(base_dir).resolve()
+    paths = sorted((base / "rules" / "measures").glob("*.json"))
+    stats = [path.stat() for path in paths]
+    fingerprint = tuple((path.name, stat.st_mtime_ns, stat.st_size) for path, stat in zip(paths, stats))
+
+    cached = _MEASURE_SPEC_CACHE.get(base)
+    if cached is not None and cached[0] == fingerprint:
+        return dict(cached[1])
+
     specs: Dict[str, MeasureSpec] = {}
-    for path in (base / "rules" / "measures").glob("*.json"):
+    for path in paths:
         payload = read_json(path, default={})
         if not payload:
             continue
         spec = MeasureSpec.from_dict(payload)
         specs[spec.measure_id] = spec
-    return specs
+    _MEASURE_SPEC_CACHE[base] = (fingerprint, specs)
+    return dict(specs)
 
 
 def evaluate_offer(base_dir: str | Path, offer_path: str | Path) -> Dict[str, Any]:
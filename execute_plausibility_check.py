@@ -8,9 +8,11 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from bafa_agent.config import load_project_config
 from bafa_agent.pipeline import evaluate_offer
-from bafa_agent.utils import write_json
+from bafa_agent.utils import write_json, write_text
 
 ALLOWED_BAFA_SUFFIXES = {".pdf", ".txt", ".md", ".json", ".doc", ".docx"}
 DEFAULT_MODEL = "gpt-5.2"
@@ -123,7 +125,7 @@ def _extract_json(text: str) -> Dict[str, Any]:
         return {}
 
     try:
-        parsed = json.loads(stripped)
+        parsed = orjson.loads(stripped)
         if isinstance(parsed, dict):
             return parsed
     except json.JSONDecodeError:
@@ -134,7 +136,7 @@ def _extract_json(text: str) -> Dict[str, Any]:
     if start != -1 and end != -1 and start < end:
         candidate = stripped[start : end + 1]
         try:
-            parsed = json.loads(candidate)
+            parsed = orjson.loads(candidate)
             if isinstance(parsed, dict):
                 return parsed
         except json.JSONDecodeError:
@@ -154,13 +156,16 @@ def _upload_file(client: Any, path: Path) -> Dict[str, str]:
     raise RuntimeError(f"failed to upload {path}: {last_error}")
 
 
-def _read_text_limited(path: Path, max_chars: int = 200_000) -> str:
-    text = path.read_text(encoding="utf-8", errors="ignore")
+def _limit_text(text: str, max_chars: int = 200_000) -> str:
     if len(text) <= max_chars:
         return text
     return text[:max_chars] + "\n\n[TRUNCATED]"
 
 
+def _read_text_limited(path: Path, max_chars: int = 200_000) -> str:
+    return _limit_text(path.read_text(encoding="utf-8", errors="ignore"), max_chars)
+
+
 def _plausibility_prompt(case_id: str) -> str:
     return (
         "Du bist ein strenger BAFA/BEG-Pruefer. "
@@ -237,46 +242,40 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
-    args = build_parser().parse_args()
-    base = Path(args.base_dir).resolve()
-    offer_path = Path(args.offer).resolve()
-    if not offer_path.exists():
-        return _fail(f"offer file not found: {offer_path}")
-
-    load_project_config(base)
+def create_client() -> Any:
     api_key = os.getenv("OPENAI_API_KEY", "")
     if not api_key:
-        return _fail("OPENAI_API_KEY is not set")
+        raise RuntimeError("OPENAI_API_KEY is not set")
 
     try:
         from openai import OpenAI
-    except Exception:
-        return _fail("python package 'openai' is not installed. Run: pip install openai")
-
-    if args.skip_evaluate:
-        case_dirs = sorted((base / "data" / "cases").glob("case_*"), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not case_dirs:
-            return _fail("no case found under data/cases; run evaluate first or remove --skip-evaluate")
-        evaluation_path = case_dirs[0] / "evaluation.json"
-        if not evaluation_path.exists():
-            return _fail(f"evaluation file not found: {evaluation_path}")
-        evaluation_payload = json.loads(evaluation_path.read_text(encoding="utf-8"))
-    else:
-        evaluation_payload = evaluate_offer(base, offer_path)
-
+    except Exception as exc:
+        raise RuntimeError("python package 'openai' is not installed. Run: pip install openai") from exc
+    return OpenAI(api_key=api_key)
+
+
+def run_plausibility_check(
+    client: Any,
+    base: Path,
+    offer_path: Path,
+    evaluation_payload: Dict[str, Any],
+    model: str = DEFAULT_MODEL,
+    source_docs_dir: str = "rules/source_docs",
+    out_path: Optional[Path] = None,
+    max_output_tokens: int = 4000,
+) -> Dict[str, Any]:
     case_id = str(evaluation_payload.get("case_id") or "unknown_case")
     case_dir = base / "data" / "cases" / case_id
     case_dir.mkdir(parents=True, exist_ok=True)
     evaluation_input_path = case_dir / "evaluation_for_plausibility.json"
-    write_json(evaluation_input_path, evaluation_payload)
+    # Serialize once; the same text is uploaded and inlined into the prompt below.
+    evaluation_text = json.dumps(evaluation_payload, indent=2, ensure_ascii=True) + "\n"
+    write_text(evaluation_input_path, evaluation_text)
 
-    source_docs_dir = (base / args.source_docs_dir).resolve()
-    bafa_files = _collect_bafa_files(source_docs_dir)
+    docs_dir = (base / source_docs_dir).resolve()
+    bafa_files = _collect_bafa_files(docs_dir)
     if not bafa_files:
-        return _fail(f"no BAFA files found in {source_docs_dir}")
-
-    client = OpenAI(api_key=api_key)
+        raise RuntimeError(f"no BAFA files found in {docs_dir}")
 
     uploaded: List[Dict[str, str]] = []
 
@@ -312,19 +311,18 @@ def main() -> int:
             }
         )
 
-    evaluation_text = _read_text_limited(evaluation_input_path)
     content.append(
         {
             "type": "input_text",
-            "text": f"LOKALES EVALUATION JSON:\n\n{evaluation_text}",
+            "text": f"LOKALES EVALUATION JSON:\n\n{_limit_text(evaluation_text)}",
         }
     )
     content.append({"type": "input_text", "text": _plausibility_prompt(case_id)})
 
     response = client.responses.create(
-        model=args.model,
+        model=model,
         input=[{"role": "user", "content": content}],
-        max_output_tokens=args.max_output_tokens,
+        max_output_tokens=max_output_tokens,
         text={
             "format": {
                 "type": "json_schema",
@@ -338,17 +336,62 @@ def main() -> int:
     raw_text = _extract_output_text(response)
     parsed = _extract_json(raw_text)
 
-    out_path = Path(args.out).resolve() if args.out else (case_dir / "plausibility_check.json")
     report = {
         "case_id": case_id,
-        "model": args.model,
+        "model": model,
         "uploaded_files": uploaded,
         "referenced_file_ids": referenced_file_ids,
         "evaluation_path": str(case_dir / "evaluation.json"),
         "plausibility": parsed,
         "raw_model_output": raw_text,
     }
-    write_json(out_path, report)
+    write_json(out_path or (case_dir / "plausibility_check.json"), report)
+    return report
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    base = Path(args.base_dir).resolve()
+    offer_path = Path(args.offer).resolve()
+    if not offer_path.exists():
+        return _fail(f"offer file not found: {offer_path}")
+
+    load_project_config(base)
+    try:
+        client = create_client()
+    except RuntimeError as exc:
+        return _fail(str(exc))
+
+    if args.skip_evaluate:
+        case_dirs = sorted((base / "data" / "cases").glob("case_*"), key=lambda p: p.stat().st_mtime, reverse=True)
+        if not case_dirs:
+            return _fail("no case found under data/cases; run evaluate first or remove --skip-evaluate")
+        evaluation_path = case_dirs[0] / "evaluation.json"
+        if not evaluation_path.exists():
+            return _fail(f"evaluation file not found: {evaluation_path}")
+        evaluation_payload = orjson.loads(evaluation_path.read_bytes())
+    else:
+        evaluation_payload = evaluate_offer(base, offer_path)
+
+    out_path = Path(args.out).resolve() if args.out else None
+    try:
+        report = run_plausibility_check(
+            client,
+            base,
+            offer_path,
+            evaluation_payload,
+            model=args.model,
+            source_docs_dir=args.source_docs_dir,
+            out_path=out_path,
+            max_output_tokens=args.max_output_tokens,
+        )
+    except RuntimeError as exc:
+        return _fail(str(exc))
+
+    case_id = report["case_id"]
+    parsed = report["plausibility"]
+    if out_path is None:
+        out_path = base / "data" / "cases" / case_id / "plausibility_check.json"
 
     print(f"plausibility check written: {out_path}")
     overall = parsed.get("overall_correct", "unknown")
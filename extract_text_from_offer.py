@@ -5,6 +5,8 @@ Auto-loads OPENAI_API_KEY from a local .env file (no shell tricks needed).
 
 Usage:
   ./extract_offer_text_ocr.py ./offer.pdf --out ./angebot.txt
+  ./extract_offer_text_ocr.py ./offer.pdf --out -    # write text to stdout
+  cat offer.pdf | ./extract_offer_text_ocr.py - --out -
 
 Dependencies:
   pip install openai pymupdf python-dotenv
@@ -21,8 +23,10 @@ import base64
 import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, List
+from typing import Any, Deque, Optional, List, Tuple
 
 # -------------------- Auto-load .env --------------------
 # It will look for a .env file in:
@@ -118,8 +122,8 @@ def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Extract plain text from offer PDFs (incl. scans) using strict OCR (auto-loads .env)."
     )
-    p.add_argument("pdf", help="Path to input PDF")
-    p.add_argument("--out", required=True, help="Path to output .txt file")
+    p.add_argument("pdf", help="Path to input PDF ('-' to read PDF bytes from stdin)")
+    p.add_argument("--out", required=True, help="Path to output .txt file ('-' for stdout)")
     p.add_argument(
         "--model",
         default=os.getenv("OPENAI_MODEL", "gpt-4o"),
@@ -135,6 +139,12 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--force-ocr", action="store_true", help="OCR every page (ignore local text)")
     p.add_argument("--max-pages", type=int, default=0, help="Limit pages processed (0 = all)")
     p.add_argument("--sleep", type=float, default=0.0, help="Sleep seconds between OCR calls (default: 0)")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("OPENAI_OCR_WORKERS", "4")),
+        help="Concurrent OCR requests (default: OPENAI_OCR_WORKERS or 4)",
+    )
     p.add_argument("--retries", type=int, default=3, help="Retries on API errors (default: 3)")
     p.add_argument(
         "--debug-env",
@@ -144,37 +154,22 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def render_page_png_bytes(pdf_path: Path, page_index: int, dpi: int) -> bytes:
-    try:
-        import fitz  # PyMuPDF
-    except Exception as e:
-        raise RuntimeError("Missing dependency: pymupdf. Install with: pip install pymupdf") from e
-
-    doc = fitz.open(str(pdf_path))
-    try:
-        page = doc.load_page(page_index)
-        zoom = dpi / 72.0
-        mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        return pix.tobytes("png")
-    finally:
-        doc.close()
+def render_page_png_bytes(doc: Any, page_index: int, dpi: int) -> bytes:
+    """Render a page of an open PyMuPDF document to PNG bytes."""
+    import pymupdf
 
+    page = doc.load_page(page_index)
+    zoom = dpi / 72.0
+    mat = pymupdf.Matrix(zoom, zoom)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    return pix.tobytes("png")
 
-def extract_local_page_text(pdf_path: Path, page_index: int) -> str:
-    """Extract embedded text (if any) from a PDF page using PyMuPDF."""
-    try:
-        import fitz  # PyMuPDF
-    except Exception as e:
-        raise RuntimeError("Missing dependency: pymupdf. Install with: pip install pymupdf") from e
 
-    doc = fitz.open(str(pdf_path))
-    try:
-        page = doc.load_page(page_index)
-        txt = page.get_text("text") or ""
-        return txt.replace("\r\n", "\n").replace("\r", "\n").strip()
-    finally:
-        doc.close()
+def extract_local_page_text(doc: Any, page_index: int) -> str:
+    """Extract embedded text (if any) from a page of an open PyMuPDF document."""
+    page = doc.load_page(page_index)
+    txt = page.get_text("text") or ""
+    return txt.replace("\r\n", "\n").replace("\r", "\n").strip()
 
 
 def ocr_page_with_openai(image_png: bytes, page_no_1based: int, model: str, retries: int = 3) -> str:
@@ -219,75 +214,148 @@ def ocr_page_with_openai(image_png: bytes, page_no_1based: int, model: str, retr
     raise RuntimeError(f"OCR failed after {retries} attempts: {last_err}")
 
 
-def main() -> int:
-    args = parse_args()
-
-    pdf_path = Path(args.pdf)
-    if not pdf_path.exists() or not pdf_path.is_file():
-        return _fail(f"input file not found: {pdf_path}")
-    if pdf_path.suffix.lower() != ".pdf":
-        return _fail(f"input must be a .pdf file: {pdf_path}")
-
-    out_path = Path(args.out)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if args.debug_env:
-        # We don't print the key; only presence.
-        has_key = bool(os.getenv("OPENAI_API_KEY"))
-        print(f"debug: cwd={Path.cwd()}", file=sys.stderr)
-        print(f"debug: script_dir={Path(__file__).resolve().parent}", file=sys.stderr)
-        print(f"debug: OPENAI_API_KEY present={has_key}", file=sys.stderr)
-        print(f"debug: OPENAI_MODEL={os.getenv('OPENAI_MODEL', '(not set)')}", file=sys.stderr)
-
-    # Open once to get page count
+def _collect_ocr_result(output_chunks: List[str], slot: int, page_no: int, future: Future) -> None:
     try:
-        import fitz  # PyMuPDF
-    except Exception:
-        return _fail("python package 'pymupdf' is not installed. Run: pip install pymupdf")
+        output_chunks[slot] = future.result().rstrip() + "\n"
+    except Exception as e:
+        output_chunks[slot] = f"===== PAGE {page_no} =====\n[OCR_FAILED]\n"
+        print(f"warn: OCR failed on page {page_no}: {e}", file=sys.stderr)
+
+
+def extract_offer_text(
+    pdf: Path | bytes,
+    model: Optional[str] = None,
+    dpi: int = 300,
+    min_local_chars: int = 40,
+    force_ocr: bool = False,
+    max_pages: int = 0,
+    sleep: float = 0.0,
+    retries: int = 3,
+    workers: Optional[int] = None,
+) -> str:
+    """Extract page-delimited text from an offer PDF (path or raw bytes), OCR-ing pages without embedded text."""
+    # Import as pymupdf: the legacy fitz alias prints a deprecation warning to
+    # stdout, which would end up in the text written by `--out -`.
+    try:
+        import pymupdf
+    except Exception as e:
+        raise RuntimeError("Missing dependency: pymupdf. Install with: pip install pymupdf") from e
+
+    model = model or os.getenv("OPENAI_MODEL", "gpt-4o")
+    if workers is None:
+        workers = int(os.getenv("OPENAI_OCR_WORKERS", "4"))
 
-    doc = fitz.open(str(pdf_path))
+    workers = max(1, workers)
+    output_chunks: List[str] = []
+    # OCR calls are network-bound: render pages here and let a thread pool run the
+    # OCR requests concurrently. Results are written back to their page slots.
+    # Rendering outpaces OCR, so cap the rendered pages in flight to bound memory.
+    max_in_flight = 2 * workers
+    pending: Deque[Tuple[int, int, Future]] = deque()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    if isinstance(pdf, (bytes, bytearray)):
+        doc = pymupdf.open(stream=pdf, filetype="pdf")
+    else:
+        doc = pymupdf.open(str(pdf))
     try:
         total_pages = doc.page_count
-    finally:
-        doc.close()
+        page_limit = max_pages if max_pages and max_pages > 0 else total_pages
+        page_limit = min(page_limit, total_pages)
 
-    max_pages = args.max_pages if args.max_pages and args.max_pages > 0 else total_pages
-    max_pages = min(max_pages, total_pages)
+        for i in range(page_limit):
+            page_no = i + 1
 
-    output_chunks: List[str] = []
-    for i in range(max_pages):
-        page_no = i + 1
+            local_text = ""
+            if not force_ocr:
+                try:
+                    local_text = extract_local_page_text(doc, i)
+                except Exception:
+                    local_text = ""
 
-        local_text = ""
-        if not args.force_ocr:
-            try:
-                local_text = extract_local_page_text(pdf_path, i)
-            except Exception:
-                local_text = ""
+            needs_ocr = force_ocr or (len(local_text) < min_local_chars)
 
-        needs_ocr = args.force_ocr or (len(local_text) < args.min_local_chars)
+            if not needs_ocr:
+                output_chunks.append(f"===== PAGE {page_no} =====\n{local_text}\n")
+                continue
 
-        if not needs_ocr:
-            output_chunks.append(f"===== PAGE {page_no} =====\n{local_text}\n")
-            continue
+            while len(pending) >= max_in_flight:
+                _collect_ocr_result(output_chunks, *pending.popleft())
 
-        try:
-            png_bytes = render_page_png_bytes(pdf_path, i, args.dpi)
-            ocr_text = ocr_page_with_openai(
+            try:
+                png_bytes = render_page_png_bytes(doc, i, dpi)
+            except Exception as e:
+                output_chunks.append(f"===== PAGE {page_no} =====\n[OCR_FAILED]\n")
+                print(f"warn: OCR failed on page {page_no}: {e}", file=sys.stderr)
+                continue
+
+            future = pool.submit(
+                ocr_page_with_openai,
                 image_png=png_bytes,
                 page_no_1based=page_no,
-                model=args.model,
-                retries=args.retries,
+                model=model,
+                retries=retries,
             )
-            output_chunks.append(ocr_text.rstrip() + "\n")
-        except Exception as e:
-            output_chunks.append(f"===== PAGE {page_no} =====\n[OCR_FAILED]\n")
-            print(f"warn: OCR failed on page {page_no}: {e}", file=sys.stderr)
+            pending.append((len(output_chunks), page_no, future))
+            output_chunks.append("")
+
+            if sleep > 0:
+                time.sleep(sleep)
+
+        while pending:
+            _collect_ocr_result(output_chunks, *pending.popleft())
+    finally:
+        pool.shutdown(wait=True)
+        doc.close()
+
+    return "\n".join(chunk.strip("\n") for chunk in output_chunks).strip() + "\n"
+
+
+def main() -> int:
+    args = parse_args()
+
+    pdf: Path | bytes
+    if args.pdf == "-":
+        pdf = sys.stdin.buffer.read()
+        if not pdf:
+            return _fail("no PDF bytes received on stdin")
+    else:
+        pdf = Path(args.pdf)
+        if not pdf.exists() or not pdf.is_file():
+            return _fail(f"input file not found: {pdf}")
+        if pdf.suffix.lower() != ".pdf":
+            return _fail(f"input must be a .pdf file: {pdf}")
+
+    to_stdout = args.out == "-"
+    out_path = Path(args.out)
+    if not to_stdout:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if args.sleep > 0:
-            time.sleep(args.sleep)
+    if args.debug_env:
+        # We don't print the key; only presence.
+        has_key = bool(os.getenv("OPENAI_API_KEY"))
+        print(f"debug: cwd={Path.cwd()}", file=sys.stderr)
+        print(f"debug: script_dir={Path(__file__).resolve().parent}", file=sys.stderr)
+        print(f"debug: OPENAI_API_KEY present={has_key}", file=sys.stderr)
+        print(f"debug: OPENAI_MODEL={os.getenv('OPENAI_MODEL', '(not set)')}", file=sys.stderr)
 
-    final_text = "\n".join(chunk.strip("\n") for chunk in output_chunks).strip() + "\n"
+    try:
+        final_text = extract_offer_text(
+            pdf,
+            model=args.model,
+            dpi=args.dpi,
+            min_local_chars=args.min_local_chars,
+            force_ocr=args.force_ocr,
+            max_pages=args.max_pages,
+            sleep=args.sleep,
+            retries=args.retries,
+            workers=args.workers,
+        )
+    except RuntimeError as e:
+        return _fail(str(e))
+
+    if to_stdout:
+        sys.stdout.write(final_text)
+        return 0
     out_path.write_text(final_text, encoding="utf-8")
     print(f"saved extracted text to: {out_path}")
     return 0
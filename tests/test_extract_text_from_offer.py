@@ -0,0 +1,92 @@
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import extract_text_from_offer
+
+HAS_PYMUPDF = importlib.util.find_spec("pymupdf") is not None
+SCRIPT = Path(__file__).resolve().parents[1] / "extract_text_from_offer.py"
+
+
+def _make_pdf(path: Path, page_texts: list[str]) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for text in page_texts:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "pymupdf not installed")
+class ExtractTextFromOfferTests(unittest.TestCase):
+    def test_stdout_output_starts_with_first_page_marker(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "offer.pdf"
+            _make_pdf(pdf, ["Fenster Uw = 0,90 W/m2K Montage 5000 EUR inkl. Einbau"])
+
+            completed = subprocess.run(
+                [sys.executable, str(SCRIPT), str(pdf), "--out", "-"],
+                cwd=tmp,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertTrue(completed.stdout.startswith("===== PAGE 1 =====\n"))
+            self.assertIn("Fenster Uw", completed.stdout)
+
+    def test_concurrent_ocr_keeps_page_order_and_failure_fallback(self):
+        workers = 2
+        lock = threading.Lock()
+        outstanding = 0
+        peak = 0
+        finished: list[int] = []
+        render = extract_text_from_offer.render_page_png_bytes
+
+        def counting_render(doc, page_index, dpi):
+            nonlocal outstanding, peak
+            with lock:
+                outstanding += 1
+                peak = max(peak, outstanding)
+            return render(doc, page_index, dpi)
+
+        def fake_ocr(image_png, page_no_1based, model, retries=3):
+            nonlocal outstanding
+            # Earlier pages take longer, so later pages complete first.
+            time.sleep(0.02 * (10 - page_no_1based))
+            with lock:
+                outstanding -= 1
+                finished.append(page_no_1based)
+            if page_no_1based == 3:
+                raise RuntimeError("rate limited")
+            return f"===== PAGE {page_no_1based} =====\nocr text {page_no_1based}"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "offer.pdf"
+            _make_pdf(pdf, ["", "Aussenwand WDVS 14 cm WLS 035 Material 12000 EUR", "", "", "", "", "", ""])
+
+            with mock.patch.object(extract_text_from_offer, "render_page_png_bytes", side_effect=counting_render), \
+                    mock.patch.object(extract_text_from_offer, "ocr_page_with_openai", side_effect=fake_ocr):
+                text = extract_text_from_offer.extract_offer_text(pdf, model="test", dpi=36, workers=workers)
+
+        self.assertNotEqual(finished, sorted(finished))
+        self.assertLessEqual(peak, 2 * workers)
+        self.assertEqual(
+            text,
+            "===== PAGE 1 =====\nocr text 1\n"
+            "===== PAGE 2 =====\nAussenwand WDVS 14 cm WLS 035 Material 12000 EUR\n"
+            "===== PAGE 3 =====\n[OCR_FAILED]\n"
+            + "".join(f"===== PAGE {n} =====\nocr text {n}\n" for n in range(4, 9)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
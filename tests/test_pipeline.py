@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from bafa_agent.pipeline import compile_rules, evaluate_offer, init_workspace
+from bafa_agent.pipeline import compile_rules, evaluate_offer, init_workspace, load_measure_specs
 
 
 class PipelineTests(unittest.TestCase):
@@ -41,6 +41,22 @@ class PipelineTests(unittest.TestCase):
             after = measure_file.read_text(encoding="utf-8")
             self.assertIn('"version": "custom_lock"', after)
 
+    def test_load_measure_specs_reloads_after_spec_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            init_workspace(base)
+
+            first = load_measure_specs(base)
+            self.assertIs(first["envelope_fenster"], load_measure_specs(base)["envelope_fenster"])
+
+            measure_file = base / "rules" / "measures" / "envelope_fenster.json"
+            payload = measure_file.read_text(encoding="utf-8")
+            measure_file.write_text(payload.replace('"version": "bootstrap"', '"version": "custom_lock"'), encoding="utf-8")
+
+            reloaded = load_measure_specs(base)
+            self.assertIsNot(first["envelope_fenster"], reloaded["envelope_fenster"])
+            self.assertEqual(reloaded["envelope_fenster"].version, "custom_lock")
+
 
 if __name__ == "__main__":
     unittest.main()
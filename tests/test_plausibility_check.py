@@ -22,6 +22,11 @@ class PlausibilityCheckTests(unittest.TestCase):
         self.assertTrue(parsed.get("overall_correct"))
         self.assertEqual(parsed.get("summary"), "ok")
 
+    def test_extract_json_flags_invalid_payload(self):
+        parsed = _extract_json("Intro {not json} Footer")
+        self.assertEqual(parsed.get("_parse_error"), "response_not_valid_json")
+        self.assertEqual(parsed.get("_raw"), "Intro {not json} Footer")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,10 +6,12 @@ from typing import Any
 
 from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from .db import Base, ENGINE, get_session
+from .db import get_session, init_db
 from .models import Application, Evaluation, JobRecord, Offer
 from .queueing import get_queue
 from .schemas import (
@@ -20,6 +22,8 @@ from .schemas import (
     OfferResponse,
 )
 
+_ALLOWED_OFFER_SUFFIXES = frozenset({".pdf", ".txt"})
+
 app = FastAPI(title="BAFA Web API", version="0.1.0")
 
 _cors_raw = os.getenv("WEB_CORS_ORIGINS", "*").strip()
@@ -35,11 +39,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.on_event("startup")
 def _startup() -> None:
-    Base.metadata.create_all(bind=ENGINE)
+    init_db()
 
 
 _UI_HTML = """<!doctype html>
@@ -595,11 +600,23 @@ def root() -> str:
     return _UI_HTML
 
 
+# The builders below use model_construct, which skips validation both here and
+# on the way out, so coerce anything the DB could hand back as NULL.
+def _application_response(row: Application) -> ApplicationResponse:
+    return ApplicationResponse.model_construct(
+        id=row.id,
+        title=row.title or "",
+        status=row.status or "",
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
 def _job_response(job: JobRecord) -> JobResponse:
-    return JobResponse(
+    return JobResponse.model_construct(
         id=job.id,
-        job_type=job.job_type,
-        status=job.status,
+        job_type=job.job_type or "",
+        status=job.status or "",
         application_id=job.application_id,
         offer_id=job.offer_id,
         payload=job.payload or {},
@@ -618,7 +635,7 @@ def _enqueue_job(
     offer_id: str | None = None,
 ) -> JobRecord:
     job = JobRecord(
-        id=str(uuid.uuid4()),
+        id=uuid.uuid4().hex,
         job_type=job_type,
         status="queued",
         application_id=application_id,
@@ -645,16 +662,7 @@ def health() -> dict[str, str]:
 @app.get("/applications", response_model=list[ApplicationResponse])
 def list_applications(session: Session = Depends(get_session)) -> list[ApplicationResponse]:
     rows = session.query(Application).order_by(Application.created_at.desc()).all()
-    return [
-        ApplicationResponse(
-            id=row.id,
-            title=row.title,
-            status=row.status,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-        )
-        for row in rows
-    ]
+    return [_application_response(row) for row in rows]
 
 
 @app.post("/applications", response_model=ApplicationResponse)
@@ -663,13 +671,7 @@ def create_application(payload: ApplicationCreate, session: Session = Depends(ge
     session.add(app_row)
     session.commit()
     session.refresh(app_row)
-    return ApplicationResponse(
-        id=app_row.id,
-        title=app_row.title,
-        status=app_row.status,
-        created_at=app_row.created_at,
-        updated_at=app_row.updated_at,
-    )
+    return _application_response(app_row)
 
 
 @app.get("/applications/{application_id}", response_model=ApplicationResponse)
@@ -677,30 +679,32 @@ def get_application(application_id: str, session: Session = Depends(get_session)
     app_row = session.get(Application, application_id)
     if app_row is None:
         raise HTTPException(status_code=404, detail="application not found")
-    return ApplicationResponse(
-        id=app_row.id,
-        title=app_row.title,
-        status=app_row.status,
-        created_at=app_row.created_at,
-        updated_at=app_row.updated_at,
-    )
+    return _application_response(app_row)
 
 
 @app.get("/applications/{application_id}/offers", response_model=list[OfferResponse])
 def list_offers(application_id: str, session: Session = Depends(get_session)) -> list[OfferResponse]:
-    rows = (
-        session.query(Offer)
-        .filter(Offer.application_id == application_id)
+    # Project only the listed columns so the offer blob and extracted text never leave the DB.
+    rows = session.execute(
+        select(
+            Offer.id,
+            Offer.application_id,
+            Offer.filename,
+            Offer.mime_type,
+            Offer.extraction_status,
+            Offer.created_at,
+            Offer.updated_at,
+        )
+        .where(Offer.application_id == application_id)
         .order_by(Offer.created_at.desc())
-        .all()
-    )
+    ).all()
     return [
-        OfferResponse(
+        OfferResponse.model_construct(
             id=row.id,
             application_id=row.application_id,
-            filename=row.filename,
-            mime_type=row.mime_type,
-            extraction_status=row.extraction_status,
+            filename=row.filename or "",
+            mime_type=row.mime_type or "",
+            extraction_status=row.extraction_status or "",
             created_at=row.created_at,
             updated_at=row.updated_at,
         )
@@ -710,18 +714,26 @@ def list_offers(application_id: str, session: Session = Depends(get_session)) ->
 
 @app.get("/applications/{application_id}/evaluations", response_model=list[EvaluationResponse])
 def list_evaluations(application_id: str, session: Session = Depends(get_session)) -> list[EvaluationResponse]:
-    rows = (
-        session.query(Evaluation)
-        .filter(Evaluation.application_id == application_id)
+    rows = session.execute(
+        select(
+            Evaluation.id,
+            Evaluation.application_id,
+            Evaluation.offer_id,
+            Evaluation.status,
+            Evaluation.evaluation_payload,
+            Evaluation.plausibility_payload,
+            Evaluation.created_at,
+            Evaluation.updated_at,
+        )
+        .where(Evaluation.application_id == application_id)
         .order_by(Evaluation.created_at.desc())
-        .all()
-    )
+    ).all()
     return [
-        EvaluationResponse(
+        EvaluationResponse.model_construct(
             id=row.id,
             application_id=row.application_id,
             offer_id=row.offer_id,
-            status=row.status,
+            status=row.status or "",
             evaluation_payload=row.evaluation_payload or {},
             plausibility_payload=row.plausibility_payload or {},
             created_at=row.created_at,
@@ -744,7 +756,7 @@ def compile_latest(session: Session = Depends(get_session)) -> JobResponse:
 
 
 @app.post("/applications/{application_id}/offers", response_model=JobResponse)
-async def upload_offer(
+def upload_offer(
     application_id: str,
     file: UploadFile = File(...),
     session: Session = Depends(get_session),
@@ -754,10 +766,13 @@ async def upload_offer(
         raise HTTPException(status_code=404, detail="application not found")
 
     filename = file.filename or "offer.pdf"
-    suffix = ("." + filename.rsplit(".", 1)[-1].lower()) if "." in filename else ""
-    if suffix not in {".pdf", ".txt"}:
+    _, dot, ext = filename.rpartition(".")
+    suffix = "." + ext.lower() if dot else ""
+    if suffix not in _ALLOWED_OFFER_SUFFIXES:
         raise HTTPException(status_code=400, detail="only .pdf or .txt offers are supported")
-    blob = await file.read()
+    # Sync handler: FastAPI runs it in the threadpool, so the blocking read, DB commit
+    # and Redis enqueue below no longer stall the event loop.
+    blob = file.file.read()
     if not blob:
         raise HTTPException(status_code=400, detail="empty file")
 
@@ -789,7 +804,9 @@ def evaluate_offer_job(application_id: str, offer_id: str, session: Session = De
     app_row = session.get(Application, application_id)
     if app_row is None:
         raise HTTPException(status_code=404, detail="application not found")
-    offer = session.get(Offer, offer_id)
+    offer = session.execute(
+        select(Offer.application_id, Offer.extraction_status).where(Offer.id == offer_id)
+    ).one_or_none()
     if offer is None or offer.application_id != application_id:
         raise HTTPException(status_code=404, detail="offer not found")
     if offer.extraction_status != "done":
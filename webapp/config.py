@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from bafa_agent.config import load_project_config
 
 
+@lru_cache(maxsize=4)
+def _load_config_once(root: Path) -> None:
+    load_project_config(root)
+
+
 def project_root() -> Path:
     root = Path(os.getenv("BAFA_BASE_DIR", ".")).resolve()
-    load_project_config(root)
+    _load_config_once(root)
     return root
 
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import threading
+from typing import Any
+
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from .config import database_url
@@ -10,9 +14,61 @@ class Base(DeclarativeBase):
     pass
 
 
-ENGINE = create_engine(database_url(), pool_pre_ping=True)
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode("utf-8")
+
+
+ENGINE = create_engine(
+    database_url(),
+    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(bind=ENGINE, autoflush=False, autocommit=False)
 
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+if ENGINE.url.get_backend_name() == "sqlite":
+
+    @event.listens_for(ENGINE, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        # WAL lets API reads proceed while the worker writes; NORMAL sync is safe under WAL.
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+_DB_READY = False
+_DB_LOCK = threading.Lock()
+
+
+def init_db() -> None:
+    global _DB_READY
+    if _DB_READY:
+        return
+    with _DB_LOCK:
+        if _DB_READY:
+            return
+        from . import models  # noqa: F401  (registers the tables on Base.metadata)
+
+        Base.metadata.create_all(bind=ENGINE)
+        # create_all skips tables that already exist, so indexes declared after a
+        # table was first created would never reach existing databases.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=ENGINE, checkfirst=True)
+        _DB_READY = True
+
 
 def get_session():
     session = SessionLocal()
@@ -20,4 +76,3 @@ def get_session():
         yield session
     finally:
         session.close()
-
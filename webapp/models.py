@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, LargeBinary, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
@@ -23,7 +23,7 @@ def _json_type():
 class Application(Base):
     __tablename__ = "applications"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex)
     title: Mapped[str] = mapped_column(String(255), default="")
     status: Mapped[str] = mapped_column(String(32), default="draft")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
@@ -39,12 +39,13 @@ class Application(Base):
 
 class Offer(Base):
     __tablename__ = "offers"
+    __table_args__ = (Index("ix_offers_application_id_created_at", "application_id", "created_at"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"), index=True)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex)
+    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"))
     filename: Mapped[str] = mapped_column(String(512))
     mime_type: Mapped[str] = mapped_column(String(128), default="application/octet-stream")
-    file_bytes: Mapped[bytes] = mapped_column(LargeBinary)
+    file_bytes: Mapped[bytes] = mapped_column(LargeBinary, deferred=True)
     extracted_text: Mapped[str] = mapped_column(Text, default="")
     extraction_status: Mapped[str] = mapped_column(String(32), default="queued")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
@@ -57,9 +58,10 @@ class Offer(Base):
 
 class Evaluation(Base):
     __tablename__ = "evaluations"
+    __table_args__ = (Index("ix_evaluations_application_id_created_at", "application_id", "created_at"),)
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"), index=True)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex)
+    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"))
     offer_id: Mapped[str] = mapped_column(ForeignKey("offers.id"), index=True)
     status: Mapped[str] = mapped_column(String(32), default="queued")
     evaluation_payload: Mapped[dict] = mapped_column(_json_type(), default=dict)
@@ -73,13 +75,17 @@ class Evaluation(Base):
 
 class JobRecord(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_application_id_status", "application_id", "status"),
+        Index("ix_jobs_offer_id_status", "offer_id", "status"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: uuid.uuid4().hex)
     job_type: Mapped[str] = mapped_column(String(64), index=True)
     status: Mapped[str] = mapped_column(String(32), default="queued", index=True)
     rq_job_id: Mapped[str] = mapped_column(String(64), default="", index=True)
-    application_id: Mapped[str | None] = mapped_column(ForeignKey("applications.id"), nullable=True, index=True)
-    offer_id: Mapped[str | None] = mapped_column(ForeignKey("offers.id"), nullable=True, index=True)
+    application_id: Mapped[str | None] = mapped_column(ForeignKey("applications.id"), nullable=True)
+    offer_id: Mapped[str | None] = mapped_column(ForeignKey("offers.id"), nullable=True)
     payload: Mapped[dict] = mapped_column(_json_type(), default=dict)
     result: Mapped[dict] = mapped_column(_json_type(), default=dict)
     error_message: Mapped[str] = mapped_column(Text, default="")
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
-from redis import Redis
+import os
+import threading
+
+from redis import ConnectionPool, Redis
 from rq import Queue
 
 from .config import redis_url
 
+_POOL: ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+_QUEUES: dict[str, Queue] = {}
+
+
+def _get_pool() -> ConnectionPool:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ConnectionPool.from_url(
+                    redis_url(),
+                    max_connections=int(os.getenv("REDIS_POOL_SIZE", "32")),
+                    socket_keepalive=True,
+                )
+    return _POOL
+
 
 def get_redis() -> Redis:
-    return Redis.from_url(redis_url())
+    return Redis(connection_pool=_get_pool())
 
 
 def get_queue(name: str = "default") -> Queue:
-    return Queue(name, connection=get_redis())
-
+    queue = _QUEUES.get(name)
+    if queue is None:
+        queue = _QUEUES.setdefault(name, Queue(name, connection=get_redis()))
+    return queue
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from rq import Worker
+from rq import SimpleWorker
 
-from .db import Base, ENGINE
+from . import worker_tasks  # noqa: F401  (import the pipeline once, not per job)
+from .db import init_db
 from .queueing import get_redis
 
 
 def main() -> int:
-    Base.metadata.create_all(bind=ENGINE)
-    worker = Worker(["default"], connection=get_redis())
+    init_db()
+    # SimpleWorker runs jobs in this process instead of forking per job, so the imports
+    # above and the DB/Redis pools stay warm across jobs.
+    worker = SimpleWorker(["default"], connection=get_redis())
     worker.work(with_scheduler=True)
     return 0
 
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
 import os
-import subprocess
-import sys
 import tempfile
 from pathlib import Path
 from typing import Any, Callable, Dict
 
+from sqlalchemy import update
+from sqlalchemy.orm import undefer
+
 from bafa_agent.pipeline import compile_rules, evaluate_offer
+from execute_plausibility_check import DEFAULT_MODEL, create_client, run_plausibility_check
+from extract_text_from_offer import extract_offer_text
 
 from .config import project_root
 from .db import SessionLocal
@@ -35,20 +37,9 @@ def _set_job_status(
     session.commit()
 
 
-def _run_subprocess(command: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        command,
-        cwd=str(cwd),
-        env=os.environ.copy(),
-        text=True,
-        capture_output=True,
-        check=True,
-    )
-
-
 def _extract_offer_job(session, job: JobRecord) -> Dict[str, Any]:
     offer_id = str(job.payload.get("offer_id", ""))
-    offer = session.get(Offer, offer_id)
+    offer = session.get(Offer, offer_id, options=[undefer(Offer.file_bytes)])
     if offer is None:
         raise RuntimeError(f"offer not found: {offer_id}")
 
@@ -56,29 +47,13 @@ def _extract_offer_job(session, job: JobRecord) -> Dict[str, Any]:
     if suffix == ".txt":
         extracted_text = offer.file_bytes.decode("utf-8", errors="ignore")
     elif suffix == ".pdf":
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp = Path(tmp_dir)
-            in_path = tmp / offer.filename
-            out_path = tmp / "offer.txt"
-            in_path.write_bytes(offer.file_bytes)
-            _run_subprocess(
-                [
-                    sys.executable,
-                    str(_repo_root() / "extract_text_from_offer.py"),
-                    str(in_path),
-                    "--out",
-                    str(out_path),
-                ],
-                cwd=_repo_root(),
-            )
-            extracted_text = out_path.read_text(encoding="utf-8")
+        extracted_text = extract_offer_text(offer.file_bytes)
     else:
         raise RuntimeError("unsupported offer file type; only .pdf and .txt are supported")
 
     offer.extracted_text = extracted_text
     offer.extraction_status = "done"
     session.add(offer)
-    session.commit()
 
     return {
         "offer_id": offer.id,
@@ -96,7 +71,6 @@ def _compile_latest_bafa_job(session, job: JobRecord) -> Dict[str, Any]:
         if app:
             app.status = "rules_compiled"
             session.add(app)
-            session.commit()
     return report
 
 
@@ -115,22 +89,14 @@ def _evaluate_offer_job(session, job: JobRecord) -> Dict[str, Any]:
 
         evaluation_payload = evaluate_offer(base_dir=_repo_root(), offer_path=offer_txt_path)
 
-        plausibility_path = tmp / "plausibility_check.json"
-        _run_subprocess(
-            [
-                sys.executable,
-                str(_repo_root() / "execute_plausibility_check.py"),
-                "--base-dir",
-                str(_repo_root()),
-                "--offer",
-                str(offer_txt_path),
-                "--quiet",
-                "--out",
-                str(plausibility_path),
-            ],
-            cwd=_repo_root(),
+        plausibility_report = run_plausibility_check(
+            create_client(),
+            _repo_root(),
+            offer_txt_path,
+            evaluation_payload,
+            model=os.getenv("OPENAI_PLAUSIBILITY_MODEL", DEFAULT_MODEL),
+            out_path=tmp / "plausibility_check.json",
         )
-        plausibility_report = json.loads(plausibility_path.read_text(encoding="utf-8"))
 
     evaluation = Evaluation(
         application_id=offer.application_id,
@@ -145,7 +111,7 @@ def _evaluate_offer_job(session, job: JobRecord) -> Dict[str, Any]:
     if app:
         app.status = "evaluated"
         session.add(app)
-    session.commit()
+    session.flush()
 
     return {
         "evaluation_id": evaluation.id,
@@ -162,8 +128,15 @@ JOB_HANDLERS: Dict[str, Callable[[Any, JobRecord], Dict[str, Any]]] = {
 
 
 def run_job(job_id: str) -> Dict[str, Any]:
+    # Handlers only stage their writes; the terminal status update commits them together.
     session = SessionLocal()
+    job = None
     try:
+        # Flip to running with a bare UPDATE before loading the row, so the commit does
+        # not expire the job we are about to hand to the handler.
+        session.execute(update(JobRecord).where(JobRecord.id == job_id).values(status="running"))
+        session.commit()
+
         job = session.get(JobRecord, job_id)
         if job is None:
             raise RuntimeError(f"job not found: {job_id}")
@@ -171,12 +144,12 @@ def run_job(job_id: str) -> Dict[str, Any]:
         if handler is None:
             raise RuntimeError(f"unknown job_type: {job.job_type}")
 
-        _set_job_status(session, job, status="running")
         result = handler(session, job)
         _set_job_status(session, job, status="done", result=result)
         return result
     except Exception as exc:
-        if "job" in locals() and job is not None:
+        session.rollback()
+        if job is not None:
             _set_job_status(session, job, status="failed", error=str(exc))
         raise
     finally: